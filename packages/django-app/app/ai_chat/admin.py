@@ -1,5 +1,10 @@
 from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+from django.db.models.functions import Substr
+from django.urls import reverse
+from django.utils.html import conditional_escape, format_html
+from django.utils.safestring import mark_safe
 
 from .models import (
     AIModel,
@@ -10,6 +15,18 @@ from .models import (
     UserProviderConfig,
 )
 
+CONTENT_PREVIEW_PREFIX = mark_safe(
+    '<div style="max-width: 400px; white-space: pre-wrap;">'
+)
+CONTENT_PREVIEW_SUFFIX = mark_safe("</div>")
+CONTENT_PREVIEW_LENGTH = 100
+
+
+def _truncate_preview(text: str) -> str:
+    if len(text) > CONTENT_PREVIEW_LENGTH:
+        return text[:CONTENT_PREVIEW_LENGTH] + "..."
+    return text
+
 
 @admin.register(AIProvider)
 class AIProviderAdmin(admin.ModelAdmin):
@@ -43,7 +60,7 @@ class AIModelAdmin(admin.ModelAdmin):
     list_filter = ["provider", "is_active", "created_at"]
     search_fields = ["name", "display_name", "description"]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
-    raw_id_fields = ["provider"]
+    autocomplete_fields = ["provider"]
 
     fieldsets = (
         (None, {"fields": ("name", "provider", "display_name", "is_active")}),
@@ -61,24 +78,19 @@ class AIModelAdmin(admin.ModelAdmin):
     )
 
 
-class ChatMessageInline(admin.TabularInline):
-    model = ChatMessage
-    extra = 0
-    readonly_fields = ["id", "created_at", "content_preview"]
-    fields = ["role", "content_preview", "created_at"]
+class ChatSessionChangeList(ChangeList):
+    """
+    Annotates the message count shown on the changelist. Kept off
+    `ChatSessionAdmin.get_queryset`, which also backs the session autocomplete
+    and the change and delete views.
+    """
 
-    def content_preview(self, obj):
-        if obj.content:
-            preview = (
-                obj.content[:100] + "..." if len(obj.content) > 100 else obj.content
-            )
-            return format_html(
-                '<div style="max-width: 300px; white-space: pre-wrap;">{}</div>',
-                preview,
-            )
-        return "-"
-
-    content_preview.short_description = "Content Preview"
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .annotate(_message_count=Count("messages"))
+        )
 
 
 @admin.register(ChatSession)
@@ -92,17 +104,25 @@ class ChatSessionAdmin(admin.ModelAdmin):
         "modified_at",
     ]
     list_filter = ["created_at", "modified_at"]
-    search_fields = ["title", "user__email", "user__first_name", "user__last_name"]
-    readonly_fields = ["id", "uuid", "created_at", "modified_at", "message_count"]
-    raw_id_fields = ["user"]
-    inlines = [ChatMessageInline]
+    search_fields = ["^title", "=user__email"]
+    ordering = ["-modified_at"]
+    readonly_fields = [
+        "id",
+        "uuid",
+        "created_at",
+        "modified_at",
+        "message_count",
+        "messages_link",
+    ]
+    autocomplete_fields = ["user"]
+    list_select_related = ["user"]
 
     fieldsets = (
         (None, {"fields": ("user", "title")}),
         (
             "Statistics",
             {
-                "fields": ("message_count",),
+                "fields": ("message_count", "messages_link"),
             },
         ),
         (
@@ -119,11 +139,42 @@ class ChatSessionAdmin(admin.ModelAdmin):
 
     title_or_id.short_description = "Title"
 
+    def get_changelist(self, request, **kwargs):
+        return ChatSessionChangeList
+
     def message_count(self, obj):
+        if hasattr(obj, "_message_count"):
+            return obj._message_count
         return obj.messages.count()
 
     message_count.short_description = "Messages"
 
+    def messages_link(self, obj):
+        if not obj.pk:
+            return "-"
+        return format_html(
+            '<a href="{}?session={}">View messages</a>',
+            reverse("admin:ai_chat_chatmessage_changelist"),
+            obj.pk,
+        )
+
+    messages_link.short_description = "Message History"
+
+
+class ChatMessageChangeList(ChangeList):
+    """
+    Loads only the columns shown on the changelist. `content` is reduced to the
+    characters needed for `content_preview` instead of the full message body.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .annotate(_preview=Substr("content", 1, CONTENT_PREVIEW_LENGTH + 1))
+            .only("id", "uuid", "role", "created_at", "session")
+        )
+
 
 @admin.register(ChatMessage)
 class ChatMessageAdmin(admin.ModelAdmin):
@@ -135,9 +186,11 @@ class ChatMessageAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["role", "created_at"]
+    date_hierarchy = "created_at"
     search_fields = ["content", "session__title", "session__user__email"]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
-    raw_id_fields = ["session"]
+    autocomplete_fields = ["session"]
+    list_select_related = ["session", "session__user"]
 
     fieldsets = (
         (None, {"fields": ("session", "role", "content")}),
@@ -155,14 +208,15 @@ class ChatMessageAdmin(admin.ModelAdmin):
 
     session_title.short_description = "Session"
 
+    def get_changelist(self, request, **kwargs):
+        return ChatMessageChangeList
+
     def content_preview(self, obj):
-        if obj.content:
-            preview = (
-                obj.content[:100] + "..." if len(obj.content) > 100 else obj.content
-            )
-            return format_html(
-                '<div style="max-width: 400px; white-space: pre-wrap;">{}</div>',
-                preview,
+        if obj._preview:
+            return (
+                CONTENT_PREVIEW_PREFIX
+                + conditional_escape(_truncate_preview(obj._preview))
+                + CONTENT_PREVIEW_SUFFIX
             )
         return "-"
 
@@ -175,13 +229,11 @@ class UserAISettingsAdmin(admin.ModelAdmin):
     list_filter = ["created_at", "preferred_model__provider"]
     search_fields = [
         "user__email",
-        "user__first_name",
-        "user__last_name",
         "preferred_model__name",
         "preferred_model__display_name",
     ]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
-    raw_id_fields = ["user", "preferred_model"]
+    autocomplete_fields = ["user", "preferred_model"]
 
     fieldsets = (
         (None, {"fields": ("user", "preferred_model")}),
@@ -195,6 +247,25 @@ class UserAISettingsAdmin(admin.ModelAdmin):
     )
 
 
+class UserProviderConfigChangeList(ChangeList):
+    """
+    Annotates the enabled model count and API key flag shown on the changelist,
+    so neither is computed per row nor on the change and delete views.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .annotate(
+                _enabled_models_count=Count("enabled_models"),
+                _has_api_key=ExpressionWrapper(
+                    ~Q(api_key=""), output_field=BooleanField()
+                ),
+            )
+        )
+
+
 @admin.register(UserProviderConfig)
 class UserProviderConfigAdmin(admin.ModelAdmin):
     list_display = [
@@ -209,12 +280,11 @@ class UserProviderConfigAdmin(admin.ModelAdmin):
     list_filter = ["provider", "is_enabled", "created_at"]
     search_fields = [
         "user__email",
-        "user__first_name",
-        "user__last_name",
         "provider__name",
     ]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
-    raw_id_fields = ["user", "provider"]
+    autocomplete_fields = ["user", "provider"]
+    list_select_related = ["user", "provider"]
 
     fieldsets = (
         (None, {"fields": ("user", "provider", "is_enabled")}),
@@ -241,14 +311,17 @@ class UserProviderConfigAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return UserProviderConfigChangeList
+
     def has_api_key(self, obj):
-        return bool(obj.api_key)
+        return obj._has_api_key
 
     has_api_key.boolean = True
     has_api_key.short_description = "Has API Key"
 
     def enabled_models_count(self, obj):
-        return obj.enabled_models.count()
+        return obj._enabled_models_count
 
     enabled_models_count.short_description = "Enabled Models"
 
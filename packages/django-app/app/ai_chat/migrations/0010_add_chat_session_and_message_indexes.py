@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2 on 2026-10-14 15:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_chat", "0009_chatmessage_ai_model"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatmessage",
+            index=models.Index(
+                fields=["session", "created_at"], name="ai_chat_mes_session_ab267a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chatsession",
+            index=models.Index(
+                fields=["user", "-modified_at"], name="ai_chat_ses_user_id_dd182c_idx"
+            ),
+        ),
+    ]
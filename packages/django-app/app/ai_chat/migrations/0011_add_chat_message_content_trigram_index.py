@@ -0,0 +1,43 @@
+# Generated by Django 5.0.2 on 2026-10-14 15:34
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_chat", "0010_add_chat_session_and_message_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Django 5.0.2 renders the opclass inside the expression's parentheses,
+        # `((UPPER("content") gin_trgm_ops))`, which PostgreSQL rejects. Create
+        # the index with raw SQL and keep the model state in sync separately.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        'CREATE INDEX "chatmessage_content_trgm" ON "ai_chat_messages" '
+                        'USING gin ((UPPER("content")) gin_trgm_ops);'
+                    ),
+                    reverse_sql='DROP INDEX IF EXISTS "chatmessage_content_trgm";',
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="chatmessage",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.functions.text.Upper("content"),
+                            name="gin_trgm_ops",
+                        ),
+                        name="chatmessage_content_trgm",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.2 on 2026-10-14 15:39
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_chat", "0011_add_chat_message_content_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Django 5.0.2 renders the opclass inside the expression's parentheses,
+        # `((UPPER("title") text_pattern_ops))`, which PostgreSQL rejects. Create
+        # the index with raw SQL and keep the model state in sync separately.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        'CREATE INDEX "chatsession_title_upper_idx" ON "ai_chat_sessions" '
+                        '((UPPER("title")) text_pattern_ops);'
+                    ),
+                    reverse_sql='DROP INDEX IF EXISTS "chatsession_title_upper_idx";',
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="chatsession",
+                    index=models.Index(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.functions.text.Upper("title"),
+                            name="text_pattern_ops",
+                        ),
+                        name="chatsession_title_upper_idx",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from common.models.crud_timestamps_mixin import CRUDTimestampsMixin
 from common.models.uuid_mixin import UUIDModelMixin
@@ -12,6 +14,16 @@ class ChatSession(UUIDModelMixin, CRUDTimestampsMixin):
     class Meta:
         db_table = "ai_chat_sessions"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["user", "-modified_at"]),
+            # Serves the admin's `^title` search, which Django compiles to
+            # `UPPER(title) LIKE UPPER('term%')` on PostgreSQL.
+            # Created with raw SQL in migration 0012, see the note there.
+            models.Index(
+                OpClass(Upper("title"), name="text_pattern_ops"),
+                name="chatsession_title_upper_idx",
+            ),
+        ]
 
 
 class ChatMessage(UUIDModelMixin, CRUDTimestampsMixin):
@@ -27,3 +39,13 @@ class ChatMessage(UUIDModelMixin, CRUDTimestampsMixin):
     class Meta:
         db_table = "ai_chat_messages"
         ordering = ("created_at",)
+        indexes = [
+            models.Index(fields=["session", "created_at"]),
+            # Trigram index for the admin's `content` search, which Django
+            # compiles to `UPPER(content) LIKE UPPER('%term%')` on PostgreSQL.
+            # Created with raw SQL in migration 0011, see the note there.
+            GinIndex(
+                OpClass(Upper("content"), name="gin_trgm_ops"),
+                name="chatmessage_content_trgm",
+            ),
+        ]
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from django.db.models import Exists, OuterRef
+
 from ai_chat.models import UserAISettings, UserProviderConfig
 from common.repositories.base_repository import BaseRepository
 
@@ -32,18 +34,18 @@ class UserSettingsRepository(BaseRepository):
         Returns:
             bool: True if user has preferred model and at least one API key configured
         """
-        settings = self.get_user_settings(user)
-        if not settings or not settings.preferred_model:
-            return False
-
         # Check if user has at least one API key configured
         provider_configs = (
-            UserProviderConfig.objects.filter(user=user, is_enabled=True)
+            UserProviderConfig.objects.filter(user=OuterRef("user"), is_enabled=True)
             .exclude(api_key__isnull=True)
             .exclude(api_key__exact="")
         )
 
-        return provider_configs.exists()
+        return (
+            UserAISettings.objects.filter(user=user, preferred_model__isnull=False)
+            .filter(Exists(provider_configs))
+            .exists()
+        )
 
     def get_api_key(self, user, provider) -> Optional[str]:
         """
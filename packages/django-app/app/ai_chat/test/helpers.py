@@ -1,3 +1,5 @@
+from typing import Any, List
+
 import factory
 from factory import Faker, SubFactory
 from factory.django import DjangoModelFactory
@@ -57,8 +59,7 @@ class UserProviderConfigFactory(DjangoModelFactory):
 
         if extracted:
             # If models are passed in, use them
-            for model in extracted:
-                self.enabled_models.add(model)
+            models = extracted
         else:
             # Get or create some default models for this provider
             model1, _ = AIModel.objects.get_or_create(
@@ -79,7 +80,17 @@ class UserProviderConfigFactory(DjangoModelFactory):
                     "is_active": True,
                 },
             )
-            self.enabled_models.add(model1, model2)
+            models = [model1, model2]
+
+        # Insert all through rows at once instead of one add() per model
+        through_model = UserProviderConfig.enabled_models.through
+        through_model.objects.bulk_create(
+            [
+                through_model(userproviderconfig_id=self.id, aimodel_id=model.id)
+                for model in models
+            ],
+            ignore_conflicts=True,
+        )
 
 
 class ChatSessionFactory(DjangoModelFactory):
@@ -99,6 +110,14 @@ class ChatMessageFactory(DjangoModelFactory):
         model = ChatMessage
         skip_postgeneration_save = True
 
+    @classmethod
+    def create_batch_bulk(cls, size: int, **kwargs: Any) -> List[ChatMessage]:
+        """
+        Build `size` messages and insert them with a single `bulk_create`.
+        Related objects such as `session` must already be saved.
+        """
+        return ChatMessage.objects.bulk_create(cls.build_batch(size, **kwargs))
+
     @factory.post_generation
     def user_session_match(obj, create, extracted, **kwargs):
         """Ensure the message user matches the session user"""
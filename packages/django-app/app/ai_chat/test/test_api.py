@@ -1,6 +1,8 @@
+import json
 import uuid
 from unittest.mock import Mock, patch
 
+import factory
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.authtoken.models import Token
@@ -27,6 +29,23 @@ from core.test.helpers import UserFactory
 class AIChatAPITestCase(TestCase):
     """Test AI Chat API endpoints with mocked AI services"""
 
+    AUTHENTICATED_ENDPOINTS = (
+        ("/api/ai-chat/send/", "POST", {"message": "test", "model": "gpt-4"}),
+        ("/api/ai-chat/sessions/", "GET", None),
+        ("/api/ai-chat/sessions/test-uuid/", "GET", None),
+        ("/api/ai-chat/settings/", "GET", None),
+        ("/api/ai-chat/settings/update/", "POST", {"provider": "test"}),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._create_service_patcher = patch(
+            "ai_chat.services.ai_service_factory.AIServiceFactory.create_service"
+        )
+        cls.mock_create_service = cls._create_service_patcher.start()
+        cls.addClassCleanup(cls._create_service_patcher.stop)
+
     @classmethod
     def setUpTestData(cls):
         cls.user = UserFactory(email="test@example.com")
@@ -37,63 +56,73 @@ class AIChatAPITestCase(TestCase):
         cls.openai_provider = OpenAIProviderFactory()
         cls.anthropic_provider = AnthropicProviderFactory()
 
-    def setUp(self):
-        self.client = APIClient()
-        self.token = Token.objects.create(user=self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
-
         # Create AIModel entries for testing
-        self.gpt4_model = AIModel.objects.create(
-            name="gpt-4",
-            provider=self.openai_provider,
-            display_name="GPT-4",
-            description="Test GPT-4 model",
-            is_active=True,
-        )
-        self.gpt35_model = AIModel.objects.create(
-            name="gpt-3.5-turbo",
-            provider=self.openai_provider,
-            display_name="GPT-3.5 Turbo",
-            description="Test GPT-3.5 model",
-            is_active=True,
-        )
-
-        # Create Anthropic models for testing
-        self.claude_sonnet_model = AIModel.objects.create(
-            name="claude-3-sonnet",
-            provider=self.anthropic_provider,
-            display_name="Claude 3 Sonnet",
-            description="Test Claude 3 Sonnet model",
-            is_active=True,
-        )
-        self.claude_haiku_model = AIModel.objects.create(
-            name="claude-3-haiku",
-            provider=self.anthropic_provider,
-            display_name="Claude 3 Haiku",
-            description="Test Claude 3 Haiku model",
-            is_active=True,
+        (
+            cls.gpt4_model,
+            cls.gpt35_model,
+            cls.claude_sonnet_model,
+            cls.claude_haiku_model,
+        ) = AIModel.objects.bulk_create(
+            [
+                AIModel(
+                    name="gpt-4",
+                    provider=cls.openai_provider,
+                    display_name="GPT-4",
+                    description="Test GPT-4 model",
+                    is_active=True,
+                ),
+                AIModel(
+                    name="gpt-3.5-turbo",
+                    provider=cls.openai_provider,
+                    display_name="GPT-3.5 Turbo",
+                    description="Test GPT-3.5 model",
+                    is_active=True,
+                ),
+                # Anthropic models
+                AIModel(
+                    name="claude-3-sonnet",
+                    provider=cls.anthropic_provider,
+                    display_name="Claude 3 Sonnet",
+                    description="Test Claude 3 Sonnet model",
+                    is_active=True,
+                ),
+                AIModel(
+                    name="claude-3-haiku",
+                    provider=cls.anthropic_provider,
+                    display_name="Claude 3 Haiku",
+                    description="Test Claude 3 Haiku model",
+                    is_active=True,
+                ),
+            ],
+            batch_size=10,
         )
 
         # Create user AI settings with preferred model
-        self.user_settings = UserAISettingsFactory(
-            user=self.user, preferred_model=self.gpt4_model
+        cls.user_settings = UserAISettingsFactory(
+            user=cls.user, preferred_model=cls.gpt4_model
         )
 
         # Create provider config with API key
-        self.provider_config = UserProviderConfigFactory(
-            user=self.user,
-            provider=self.openai_provider,
+        cls.provider_config = UserProviderConfigFactory(
+            user=cls.user,
+            provider=cls.openai_provider,
             api_key="test-api-key-12345",
-            enabled_models=[self.gpt4_model, self.gpt35_model],
+            enabled_models=[cls.gpt4_model, cls.gpt35_model],
         )
 
-    @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
-    def test_send_message_success(self, mock_create_service):
+    def setUp(self):
+        self.mock_create_service.reset_mock(return_value=True, side_effect=True)
+
+        self.client = APIClient()
+        self.token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_send_message_success(self):
         """Test successful message sending through API"""
         # Mock AI service response
         mock_service = Mock()
         mock_service.send_message.return_value = "Hello! How can I help you today?"
-        mock_create_service.return_value = mock_service
+        self.mock_create_service.return_value = mock_service
 
         data = {"message": "Hello, AI!", "model": "gpt-4"}
         response = self.client.post("/api/ai-chat/send/", data, format="json")
@@ -111,21 +140,20 @@ class AIChatAPITestCase(TestCase):
         self.assertEqual(session.messages.count(), 2)  # User message + AI response
 
         # Verify mock was called correctly
-        mock_create_service.assert_called_once_with(
+        self.mock_create_service.assert_called_once_with(
             provider_name="openai",  # Determined from model name
             api_key="test-api-key-12345",
             model="gpt-4",
         )
         mock_service.send_message.assert_called_once()
 
-    @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
-    def test_send_message_with_context_blocks(self, mock_create_service):
+    def test_send_message_with_context_blocks(self):
         """Test sending message with context blocks"""
         mock_service = Mock()
         mock_service.send_message.return_value = (
             "Based on your notes, here's my advice..."
         )
-        mock_create_service.return_value = mock_service
+        self.mock_create_service.return_value = mock_service
 
         data = {
             "message": "What should I do about this?",
@@ -150,18 +178,19 @@ class AIChatAPITestCase(TestCase):
         self.assertIn("• Regular note", user_message.content)
         self.assertIn("**My question:**", user_message.content)
 
-    @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
-    def test_send_message_with_existing_session(self, mock_create_service):
+    def test_send_message_with_existing_session(self):
         """Test sending message to existing session"""
         mock_service = Mock()
         mock_service.send_message.return_value = "Continuing our conversation..."
-        mock_create_service.return_value = mock_service
+        self.mock_create_service.return_value = mock_service
 
         # Create existing session with messages
         session = ChatSessionFactory(user=self.user)
-        ChatMessageFactory(session=session, role="user", content="Previous message")
-        ChatMessageFactory(
-            session=session, role="assistant", content="Previous response"
+        ChatMessageFactory.create_batch_bulk(
+            2,
+            session=session,
+            role=factory.Iterator(["user", "assistant"]),
+            content=factory.Iterator(["Previous message", "Previous response"]),
         )
 
         data = {
@@ -213,10 +242,9 @@ class AIChatAPITestCase(TestCase):
         self.assertFalse(response.data["success"])
         self.assertIn("No API key configured for OpenAI", response.data["error"])
 
-    @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
-    def test_send_message_ai_service_error(self, mock_create_service):
+    def test_send_message_ai_service_error(self):
         """Test handling AI service errors"""
-        mock_create_service.side_effect = AIServiceError("API rate limit exceeded")
+        self.mock_create_service.side_effect = AIServiceError("API rate limit exceeded")
 
         data = {"message": "Hello", "model": "gpt-4"}
         response = self.client.post("/api/ai-chat/send/", data, format="json")
@@ -241,17 +269,21 @@ class AIChatAPITestCase(TestCase):
         session1 = ChatSessionFactory(user=self.user, title="First Chat")
         session2 = ChatSessionFactory(user=self.user, title="Second Chat")
 
-        ChatMessageFactory(
-            session=session1, role="user", content="First message in session 1"
-        )
-        ChatMessageFactory(
-            session=session1, role="assistant", content="Response to first"
+        ChatMessageFactory.create_batch_bulk(
+            2,
+            session=session1,
+            role=factory.Iterator(["user", "assistant"]),
+            content=factory.Iterator(
+                ["First message in session 1", "Response to first"]
+            ),
         )
         ChatMessageFactory(
             session=session2, role="user", content="Message in session 2"
         )
 
-        response = self.client.get("/api/ai-chat/sessions/")
+        # Token lookup + sessions query, regardless of the number of sessions
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/ai-chat/sessions/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data["success"])
@@ -259,6 +291,9 @@ class AIChatAPITestCase(TestCase):
         sessions_data = response.data["data"]
         self.assertEqual(len(sessions_data), 2)
 
+        message_counts = {s["title"]: s["message_count"] for s in sessions_data}
+        self.assertEqual(message_counts, {"First Chat": 2, "Second Chat": 1})
+
         # Check session data structure
         session_data = sessions_data[0]
         self.assertIn("uuid", session_data)
@@ -290,9 +325,23 @@ class AIChatAPITestCase(TestCase):
         """Test getting detailed chat session with messages"""
         session = ChatSessionFactory(user=self.user, title="Test Session")
         ChatMessageFactory(session=session, role="user", content="Hello")
-        ChatMessageFactory(session=session, role="assistant", content="Hi there!")
+        ChatMessageFactory(
+            session=session,
+            role="assistant",
+            content="Hi there!",
+            ai_model=self.gpt4_model,
+        )
+        ChatMessageFactory(
+            session=session,
+            role="assistant",
+            content="Hello again!",
+            ai_model=self.claude_sonnet_model,
+        )
 
-        response = self.client.get(f"/api/ai-chat/sessions/{session.uuid}/")
+        # Token lookup + session lookup + messages query, with each message's
+        # model and provider joined in rather than loaded per message
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/ai-chat/sessions/{session.uuid}/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data["success"])
@@ -300,13 +349,19 @@ class AIChatAPITestCase(TestCase):
         session_data = response.data["data"]
         self.assertEqual(session_data["uuid"], str(session.uuid))
         self.assertEqual(session_data["title"], "Test Session")
-        self.assertEqual(len(session_data["messages"]), 2)
+        self.assertEqual(len(session_data["messages"]), 3)
 
         # Check message structure
         message = session_data["messages"][0]
         self.assertIn("role", message)
         self.assertIn("content", message)
         self.assertIn("created_at", message)
+        self.assertIsNone(message["ai_model"])
+
+        self.assertEqual(
+            [m["ai_model"]["provider"] for m in session_data["messages"][1:]],
+            [self.openai_provider.name, self.anthropic_provider.name],
+        )
 
     def test_chat_session_detail_not_found(self):
         """Test getting non-existent session returns 404"""
@@ -398,29 +453,22 @@ class AIChatAPITestCase(TestCase):
         """Test all AI chat endpoints require authentication"""
         self.client.credentials()  # Remove authentication
 
-        endpoints = [
-            ("/api/ai-chat/send/", "post", {"message": "test", "model": "gpt-4"}),
-            ("/api/ai-chat/sessions/", "get", None),
-            ("/api/ai-chat/sessions/test-uuid/", "get", None),
-            ("/api/ai-chat/settings/", "get", None),
-            ("/api/ai-chat/settings/update/", "post", {"provider": "test"}),
-        ]
-
-        for url, method, data in endpoints:
+        for url, method, data in self.AUTHENTICATED_ENDPOINTS:
             with self.subTest(url=url, method=method):
-                if method == "post":
-                    response = self.client.post(url, data or {}, format="json")
-                else:
-                    response = self.client.get(url)
+                response = self.client.generic(
+                    method,
+                    url,
+                    json.dumps(data) if data is not None else "",
+                    content_type="application/json",
+                )
 
                 self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
-    @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
-    def test_send_message_invalid_session_id(self, mock_create_service):
+    def test_send_message_invalid_session_id(self):
         """Test sending message with invalid session ID creates new session"""
         mock_service = Mock()
         mock_service.send_message.return_value = "Response"
-        mock_create_service.return_value = mock_service
+        self.mock_create_service.return_value = mock_service
 
         # Use a properly formatted UUID that doesn't exist instead of "invalid-uuid"
 
@@ -158,6 +158,46 @@ class UserSettingsRepositoryTestCase(TestCase):
         api_key = self.repo.get_api_key(self.user, self.openai_provider)
         self.assertIsNone(api_key)
 
+    def test_has_valid_settings(self):
+        """Test valid settings require a preferred model and an API key"""
+        UserAISettingsFactory(user=self.user, preferred_model=self.gpt4_model)
+        UserProviderConfigFactory(
+            user=self.user, provider=self.openai_provider, api_key="test-api-key-123"
+        )
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.repo.has_valid_settings(self.user))
+
+    def test_has_valid_settings_without_preferred_model(self):
+        """Test settings without a preferred model are not valid"""
+        UserAISettingsFactory(user=self.user, preferred_model=None)
+        UserProviderConfigFactory(
+            user=self.user, provider=self.openai_provider, api_key="test-api-key-123"
+        )
+
+        self.assertFalse(self.repo.has_valid_settings(self.user))
+
+    def test_has_valid_settings_without_api_key(self):
+        """Test settings without an API key are not valid"""
+        UserAISettingsFactory(user=self.user, preferred_model=self.gpt4_model)
+        UserProviderConfigFactory(
+            user=self.user, provider=self.openai_provider, api_key=""
+        )
+
+        self.assertFalse(self.repo.has_valid_settings(self.user))
+
+    def test_has_valid_settings_disabled_provider(self):
+        """Test an API key on a disabled provider does not make settings valid"""
+        UserAISettingsFactory(user=self.user, preferred_model=self.gpt4_model)
+        UserProviderConfigFactory(
+            user=self.user,
+            provider=self.openai_provider,
+            api_key="test-api-key-123",
+            is_enabled=False,
+        )
+
+        self.assertFalse(self.repo.has_valid_settings(self.user))
+
     def test_user_isolation(self):
         """Test that user settings are properly isolated"""
         # Create settings for test user
@@ -1,6 +1,8 @@
 import logging
 from typing import TypedDict
 
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Substr
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -12,6 +14,7 @@ from .forms import SendMessageForm
 from .models import (
     AIModel,
     AIProvider,
+    ChatMessage,
     ChatSession,
     UserAISettings,
     UserProviderConfig,
@@ -91,18 +94,29 @@ def chat_sessions(request):
     Get list of chat sessions for the current user.
     """
     try:
-        sessions = ChatSession.objects.filter(user=request.user).order_by(
-            "-modified_at"
+        # Annotate the first user message for preview and the message count
+        # so the list is built from a single query
+        first_user_message = (
+            ChatMessage.objects.filter(session=OuterRef("pk"), role="user")
+            .order_by("created_at")
+            .values(preview=Substr("content", 1, 101))[:1]
+        )
+        sessions = (
+            ChatSession.objects.filter(user=request.user)
+            .annotate(
+                first_message_content=Subquery(first_user_message),
+                message_count=Count("messages"),
+            )
+            .order_by("-modified_at")
         )
 
-        # Get first message from each session for preview
         sessions_data = []
         for session in sessions:
-            first_message = session.messages.filter(role="user").first()
+            first_message_content = session.first_message_content or ""
             preview = (
-                first_message.content[:100] + "..."
-                if first_message and len(first_message.content) > 100
-                else (first_message.content if first_message else "")
+                first_message_content[:100] + "..."
+                if len(first_message_content) > 100
+                else first_message_content
             )
 
             sessions_data.append(
@@ -112,7 +126,7 @@ def chat_sessions(request):
                     "preview": preview,
                     "created_at": session.created_at.isoformat(),
                     "modified_at": session.modified_at.isoformat(),
-                    "message_count": session.messages.count(),
+                    "message_count": session.message_count,
                 }
             )
 
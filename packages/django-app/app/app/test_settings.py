@@ -4,3 +4,9 @@ from .settings import *
 Adds `common` app to installed apps so that test models are only created for tests.
 """
 INSTALLED_APPS += ["common"]
+
+"""
+Use a fast password hasher in tests. The default PBKDF2 hasher dominates the cost
+of creating and authenticating test users.
+"""
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]